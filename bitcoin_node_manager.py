@@ -4,38 +4,117 @@ Bitcoin & Electrs Node Manager
 A GUI application for managing local Bitcoin and Electrs nodes with embedded terminals.
 """
 
+import os
+import sys
+
+APP_NAME = "BitcoinNodeManager"
+
+# ── Single-instance guard (macOS / Linux) ────────────────────────────────────
+# On macOS, launching a .app can fire two launch events in quick succession,
+# causing the app to open, close, then reopen.  We hold an exclusive lock for
+# the entire lifetime of the process; any duplicate launch sees the lock
+# taken and exits silently before creating any windows.
+#
+# On Linux the lock is a name in the abstract Unix-socket namespace: the kernel
+# drops it the moment the process dies, so a crash can't leave a stale file in
+# /tmp behind.  macOS has no abstract namespace and uses flock() on a file.
+#
+# The lock is taken here, ahead of the tkinter/requests imports below, so a
+# duplicate launch exits in milliseconds instead of paying for Tk start-up.
+try:
+    import fcntl as _fcntl
+    _HAVE_FCNTL = True
+except ImportError:
+    _HAVE_FCNTL = False  # Windows — not needed there
+
+
+def _acquire_instance_lock():
+    """
+    Try to acquire the single-instance lock.
+    Returns the object holding it (a bound socket on Linux, an open file
+    elsewhere) or None if another instance already has it.
+    The caller must keep the returned object alive for the lock to persist.
+    """
+    if not _HAVE_FCNTL:
+        return None  # non-Unix — skip the guard
+
+    if sys.platform.startswith("linux"):
+        import socket
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        try:
+            sock.bind("\0" + APP_NAME)   # EADDRINUSE if already running
+            return sock
+        except OSError:
+            sock.close()
+            return None
+
+    lock_path = os.path.join("/tmp", f"{APP_NAME}.lock")
+    try:
+        # No O_TRUNC: the file is only emptied once we actually own the lock,
+        # so a duplicate launch can't wipe the running instance's pid.
+        fd = os.open(lock_path, os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC, 0o644)
+    except OSError:
+        return None
+    fh = os.fdopen(fd, 'w')
+    try:
+        _fcntl.flock(fh, _fcntl.LOCK_EX | _fcntl.LOCK_NB)
+        fh.truncate(0)
+        fh.write(str(os.getpid()))
+        fh.flush()
+        return fh          # caller holds this to keep lock alive
+    except OSError:
+        fh.close()
+        return None        # another instance already holds the lock
+
+
+_instance_lock = None      # held for the process lifetime once acquired
+if __name__ == "__main__":
+    _instance_lock = _acquire_instance_lock()
+    if _instance_lock is None and _HAVE_FCNTL:
+        sys.exit(0)        # duplicate launch — quit before the heavy imports
+
 import tkinter as tk
 from tkinter import scrolledtext, messagebox, filedialog
 import subprocess
+import shlex
+import selectors
 import threading
-import queue
-import os
-import sys
+import collections
 import time
 import json
+import hashlib
+import functools
+import heapq
+import itertools
+import concurrent.futures
 import traceback
 import requests
 from pathlib import Path
 import shutil
+import stat
 import re
 
-# ── Single-instance guard (macOS / Linux) ────────────────────────────────────
-# On macOS, launching a .app can fire two launch events in quick succession,
-# causing the app to open, close, then reopen.  We hold an exclusive file lock
-# for the entire lifetime of the process; any duplicate launch sees the lock
-# taken and exits silently before creating any windows.
+# orjson is optional: when installed it encodes/decodes RPC payloads several
+# times faster than the stdlib; otherwise json does the same job.
 try:
-    import fcntl as _fcntl
-    _HAVE_FCNTL = True
+    import orjson as _orjson
+    _HAVE_ORJSON = True
 except ImportError:
-    _HAVE_FCNTL = False  # Windows — not needed there
+    _HAVE_ORJSON = False
+
+if _HAVE_ORJSON:
+    _json_dumps = _orjson.dumps
+    _json_loads = _orjson.loads
+else:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+    _json_loads = json.loads
 
 
 # ---------------------------------------------------------------------------
 # Config path
 # ---------------------------------------------------------------------------
 
-APP_NAME        = "BitcoinNodeManager"
 CONFIG_FILENAME = "node_manager_config.json"
 
 
@@ -48,6 +127,89 @@ def get_config_dir() -> Path:
     return base
 
 
+def _config_digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+# The bitcoin.conf keys the manager reads; a later assignment overrides an
+# earlier one.
+_CONF_RE = re.compile(
+    rb'(?m)^[ \t]*(rpcport|rpcuser|rpcpassword)[ \t]*=[ \t]*(\S+)')
+
+LONGPOLL_MS = 30000   # waitfornewblock timeout once bitcoind is synced
+
+# Replies meaning bitcoind will never serve a method, as opposed to a transient
+# failure: HTTP 404 (unknown method), HTTP 403 (blocked by -rpcwhitelist) and
+# JSON-RPC "Method not found".
+_RPC_REFUSED_STATUS = frozenset({403, 404})
+_RPC_METHOD_NOT_FOUND = -32601
+
+
+# ---------------------------------------------------------------------------
+# Child process output
+# ---------------------------------------------------------------------------
+
+PIPE_CHUNK = 65536   # bytes per buffer in the log pump's read pool
+PIPE_BUFS  = 4       # buffers filled per readv() when a pipe is backed up
+
+
+# Log lines that mean electrs has caught up with bitcoind.  Matched against
+# the raw bytes in one pass, so the scan needs no decode or lower-casing.
+_ELECTRS_SYNC_RE = re.compile(
+    rb'finished full compaction|electrs running|waiting for new block',
+    re.IGNORECASE)
+
+
+def _take_lines(tail: bytearray):
+    """
+    Remove every complete line from *tail* and return them as one block of
+    raw bytes, without the final newline, or None if there is none yet.  A
+    lone b'\n' gives b'' — one empty line, which is still a line.  A trailing
+    partial line stays in *tail* until the rest of it arrives.
+
+    Callers work on the block as a whole — one regex scan, one decode, one
+    split() — so per-line cost stays mostly inside C.
+    """
+    cut = tail.rfind(b'\n')
+    if cut < 0:
+        return None
+    block = bytes(tail[:cut])
+    del tail[:cut + 1]
+    return block
+
+
+# ---------------------------------------------------------------------------
+# Background scheduler
+# ---------------------------------------------------------------------------
+
+class _Scheduler:
+    """
+    Runs periodic monitor tasks on a single background thread, so adding a
+    monitor adds a heap entry rather than another sleeping thread.
+
+    Each task returns the delay in seconds until it should run again, or None
+    to drop out.  Register tasks with add() before starting run(); the loop
+    sleeps on *stop_evt* and exits as soon as it is set.
+    """
+    def __init__(self, stop_evt):
+        self._stop_evt = stop_evt
+        self._heap     = []                  # (due, seq, task)
+        self._seq      = itertools.count()   # tie-break; tasks never compared
+
+    def add(self, task, delay=0.0):
+        heapq.heappush(self._heap, (time.monotonic() + delay, next(self._seq), task))
+
+    def run(self):
+        while self._heap:
+            due, _, task = self._heap[0]
+            if self._stop_evt.wait(max(0.0, due - time.monotonic())):
+                return
+            heapq.heappop(self._heap)
+            delay = task()
+            if delay is not None:
+                self.add(task, delay)
+
+
 # ---------------------------------------------------------------------------
 # macOS colour palette
 # ---------------------------------------------------------------------------
@@ -82,21 +244,63 @@ IND_OFF     = '#d1d1d6'
 TERM_BG     = '#1e1e1e'
 TERM_FG     = '#d4d4d4'
 
+TERM_DRAIN_MAX = 500   # lines written per terminal per drain; rest wait a turn
+TERM_MAX_LINES = 5000  # scrollback kept per terminal; older lines are dropped
+
+# Terminals stay in NORMAL state and are made read-only by swallowing keys;
+# these still get through so the log can be scrolled, selected and copied.
+_TERM_NAV_KEYS = frozenset({
+    'Up', 'Down', 'Left', 'Right', 'Prior', 'Next', 'Home', 'End',
+})
+_TERM_COPY_KEYS = frozenset({'c', 'C', 'a', 'A', 'slash'})
+_TERM_COPY_MODS = 0x4 | 0x8   # Control, Command (Mod1 on macOS)
+
+# make_btn styles: name → (fill, hover fill, text colour)
+_BTN_STYLES = {
+    'primary':     (MAC_BLUE,    MAC_BLUE_H,   TEXT_WHITE),
+    'secondary':   (BTN_FILL,    BTN_FILL_H,   TEXT_MAIN),
+    'destructive': (MAC_RED,     MAC_RED_H,    TEXT_WHITE),
+    'warning':     (MAC_ORANGE,  MAC_ORANGE_H, TEXT_WHITE),
+    'confirm':     (MAC_GREEN,   MAC_GREEN_H,  TEXT_WHITE),
+}
+_BTN_FONT = ('Helvetica Neue', 11)
+
 
 # ---------------------------------------------------------------------------
 # MacButton — tk.Label behaves as a button that respects colours on macOS.
 # tk.Button uses the native Aqua renderer which ignores bg/fg completely.
 # ---------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=32)
+def _darken_hex(hex_color: str) -> str:
+    """Return a slightly darker version of a hex colour."""
+    hex_color = hex_color.lstrip('#')
+    r, g, b = [int(hex_color[i:i+2], 16) for i in (0, 2, 4)]
+    r = max(0, int(r * 0.88))
+    g = max(0, int(g * 0.88))
+    b = max(0, int(b * 0.88))
+    return f'#{r:02x}{g:02x}{b:02x}'
+
+
 class MacButton(tk.Label):
     """
     A clickable Label that renders with explicit colours on macOS.
     Supports hover feedback and disabled state.
+
+    Event handling lives on a shared 'MacButton' bind tag, registered once
+    for the first instance, rather than three bind() calls per button.
+    Hover is pure Tcl: <Enter>/<Leave> flip the label's -state between
+    normal and active, and Tk paints -activebackground itself.
     """
+    BIND_TAG      = 'MacButton'
+    _class_bound  = False
+    _TCL_ENTER    = 'if {[%W cget -state] eq "normal"} {%W configure -state active}'
+    _TCL_LEAVE    = 'if {[%W cget -state] eq "active"} {%W configure -state normal}'
+
     def __init__(self, parent, text, command,
                  bg=BTN_FILL, fg=TEXT_MAIN,
                  hover_bg=None,
-                 font=('Helvetica Neue', 11),
+                 font=_BTN_FONT,
                  padx=14, pady=5,
                  radius=0,     # unused — kept for API compatibility
                  **kwargs):
@@ -104,46 +308,34 @@ class MacButton(tk.Label):
             parent,
             text=text,
             bg=bg, fg=fg,
+            activebackground=hover_bg if hover_bg else _darken_hex(bg),
+            activeforeground=fg,
+            disabledforeground=TEXT_TER,
             font=font,
             padx=padx, pady=pady,
             cursor='hand2',
             **kwargs
         )
-        self._bg       = bg
-        self._fg       = fg
-        self._hover_bg = hover_bg if hover_bg else self._darken(bg)
         self._command  = command
         self._enabled  = True
 
-        self.bind('<Button-1>',  self._on_press)
-        self.bind('<Enter>',     self._on_enter)
-        self.bind('<Leave>',     self._on_leave)
+        self.bindtags((self.BIND_TAG,) + self.bindtags())
+        if not MacButton._class_bound:
+            self.bind_class(self.BIND_TAG, '<Button-1>', MacButton._on_press)
+            self.bind_class(self.BIND_TAG, '<Enter>',    self._TCL_ENTER)
+            self.bind_class(self.BIND_TAG, '<Leave>',    self._TCL_LEAVE)
+            MacButton._class_bound = True
 
     @staticmethod
-    def _darken(hex_color: str) -> str:
-        """Return a slightly darker version of a hex colour."""
-        hex_color = hex_color.lstrip('#')
-        r, g, b = [int(hex_color[i:i+2], 16) for i in (0, 2, 4)]
-        r = max(0, int(r * 0.88))
-        g = max(0, int(g * 0.88))
-        b = max(0, int(b * 0.88))
-        return f'#{r:02x}{g:02x}{b:02x}'
-
-    def _on_press(self, _event):
-        if self._enabled and self._command:
-            self._command()
-
-    def _on_enter(self, _event):
-        if self._enabled:
-            self.config(bg=self._hover_bg)
-
-    def _on_leave(self, _event):
-        self.config(bg=self._bg)
+    def _on_press(event):
+        btn = event.widget
+        if btn._enabled and btn._command:
+            btn._command()
 
     def set_enabled(self, enabled: bool):
         self._enabled = enabled
         self.config(
-            fg=self._fg if enabled else TEXT_TER,
+            state=tk.NORMAL if enabled else tk.DISABLED,
             cursor='hand2' if enabled else 'arrow'
         )
 
@@ -157,22 +349,57 @@ def make_btn(parent, text, command, style='secondary', font=None, padx=14, pady=
       warning     — orange fill, white text
       confirm     — green fill, white text
     """
-    styles = {
-        'primary':     (MAC_BLUE,    MAC_BLUE_H,   TEXT_WHITE),
-        'secondary':   (BTN_FILL,    BTN_FILL_H,   TEXT_MAIN),
-        'destructive': (MAC_RED,     MAC_RED_H,    TEXT_WHITE),
-        'warning':     (MAC_ORANGE,  MAC_ORANGE_H, TEXT_WHITE),
-        'confirm':     (MAC_GREEN,   MAC_GREEN_H,  TEXT_WHITE),
-    }
-    bg, hover, fg = styles.get(style, styles['secondary'])
+    bg, hover, fg = _BTN_STYLES.get(style) or _BTN_STYLES['secondary']
     return MacButton(
         parent, text=text, command=command,
         bg=bg, fg=fg, hover_bg=hover,
-        font=font or ('Helvetica Neue', 11),
+        font=font or _BTN_FONT,
         padx=padx, pady=pady
     )
 
 
+# ---------------------------------------------------------------------------
+# Binary update helpers
+# ---------------------------------------------------------------------------
+
+@functools.lru_cache(maxsize=None)
+def _version_re(prefix: str):
+    """Compiled matcher for '<prefix>-X.Y.Z' build folder names."""
+    return re.compile(rf"^{re.escape(prefix)}-(\d+(?:\.\d+)*)$")
+
+
+def _copy_executable(src, dst):
+    """
+    Copy a binary to *dst* with mode 0755.  On Linux the bytes move with
+    os.sendfile, entirely in the kernel; elsewhere (macOS cannot sendfile
+    between regular files) shutil.copyfile uses the platform's fast path.
+    The mode is only changed when it is not 0755 already — a freshly created
+    file normally gets it straight from os.open.
+    """
+    if sys.platform.startswith('linux'):
+        with open(src, 'rb') as fsrc:
+            size = os.fstat(fsrc.fileno()).st_size
+            fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+            try:
+                offset = 0
+                while offset < size:
+                    sent = os.sendfile(fd, fsrc.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                if offset != size:
+                    # Source shrank mid-copy — don't pass off a truncated binary
+                    raise OSError(f"short copy: {offset} of {size} bytes")
+                if stat.S_IMODE(os.fstat(fd).st_mode) != 0o755:
+                    os.fchmod(fd, 0o755)
+            finally:
+                os.close(fd)
+    else:
+        shutil.copyfile(src, dst)
+        if stat.S_IMODE(os.stat(dst).st_mode) != 0o755:
+            os.chmod(dst, 0o755)
+
+
 # ---------------------------------------------------------------------------
 # Main application
 # ---------------------------------------------------------------------------
@@ -196,6 +423,17 @@ class NodeManagerGUI:
         self.sv_binaries_path     = tk.StringVar()
         self.sv_bitcoin_data_path = tk.StringVar()
         self.sv_electrs_data_path = tk.StringVar()
+        # Path objects are rebuilt only when their StringVar is written, so the
+        # properties below never round-trip through Tk or allocate a Path.
+        for sv, attr in [
+            (self.sv_binaries_path,     '_binaries_path'),
+            (self.sv_bitcoin_data_path, '_bitcoin_data_path'),
+            (self.sv_electrs_data_path, '_electrs_data_path'),
+        ]:
+            setattr(self, attr, Path(sv.get()))
+            sv.trace_add("write", lambda *_, sv=sv, attr=attr:
+                         setattr(self, attr, Path(sv.get())))
+        self._last_cfg_hash       = None   # digest of the config file on disk
         self._load_config()
 
         # ── Process handles ──────────────────────────────────────────────────
@@ -203,11 +441,35 @@ class NodeManagerGUI:
         self.electrs_process  = None
 
         # ── Queues ───────────────────────────────────────────────────────────
-        self.bitcoin_queue = queue.Queue()
-        self.electrs_queue = queue.Queue()
+        # deque append/popleft are atomic, so the log pump and the Tk thread
+        # share these without the per-item lock round-trip of queue.Queue.
+        self.bitcoin_queue = collections.deque()
+        self.electrs_queue = collections.deque()
+        self._log_pending  = False   # wake already sent, cleared by the drain
+        self._log_backlog_after = None   # after() id of a pending backlog drain
+        # Self-pipe: producers write a byte, a Tk file handler reads it.  No
+        # Tk call ever happens off the Tk thread, and an idle app sleeps.
+        self._log_wake_r, self._log_wake_w = os.pipe()
+        os.set_blocking(self._log_wake_r, False)
+        os.set_blocking(self._log_wake_w, False)
+
+        # ── Log pump — one selector thread drains every node's stdout ────────
+        self._log_selector = selectors.DefaultSelector()
 
         # ── RPC ──────────────────────────────────────────────────────────────
-        self.rpc_port = 8332
+        self.rpc_port      = 8332
+        self._conf_cache   = {}   # path → (mtime_ns, parsed bitcoin.conf)
+        self._cookie_cache = {}   # path → (mtime_ns, (user, password))
+
+        # One keep-alive session for every RPC: the monitor's polls reuse a warm
+        # socket instead of a fresh TCP connection each time.
+        self._rpc_session = requests.Session()
+        self._rpc_session.headers['content-type'] = 'application/json'
+        self._rpc_session.mount('http://', requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=4))
+        self._rpc_auth = None           # HTTPBasicAuth, cached until invalid
+        self._longpoll_ok = True        # waitfornewblock armed; re-armed after a transient failure
+        self._longpoll_refused = False  # bitcoind refused waitfornewblock this run
 
         # ── Status ───────────────────────────────────────────────────────────
         self.bitcoin_running      = False
@@ -216,8 +478,18 @@ class NodeManagerGUI:
         self.electrs_synced       = False
         self.current_block_height = 0
         self.electrs_start_time   = None
+        self._electrs_sync_seen   = False   # latched by the log pump, applied by the drain
+        self._ui_dirty            = False   # redraw queued via after_idle
+
+        # ── Background threads sleep on this; set() makes them exit at once ──
+        self._stop_evt = threading.Event()
+        self._closing  = False   # on_closing has taken over shutdown
 
         # ── Build UI then reveal ─────────────────────────────────────────────
+        self._terminal_slots = {}   # node type → placeholder frame
+        self._terminals      = {}   # node type → ScrolledText, built lazily
+        self._launch_btns    = {}   # node type → Launch MacButton
+        self._updating_binaries = False   # copy worker running; launches blocked
         self.setup_gui()
         self.root.update_idletasks()
         # Centre on screen
@@ -247,15 +519,15 @@ class NodeManagerGUI:
 
     @property
     def binaries_path(self) -> Path:
-        return Path(self.sv_binaries_path.get())
+        return self._binaries_path
 
     @property
     def bitcoin_data_path(self) -> Path:
-        return Path(self.sv_bitcoin_data_path.get())
+        return self._bitcoin_data_path
 
     @property
     def electrs_data_path(self) -> Path:
-        return Path(self.sv_electrs_data_path.get())
+        return self._electrs_data_path
 
     # ── Config persistence ───────────────────────────────────────────────────
 
@@ -269,8 +541,9 @@ class NodeManagerGUI:
         cfg = {}
         if self.config_path.exists():
             try:
-                with open(self.config_path) as f:
-                    cfg = json.load(f)
+                raw = self.config_path.read_bytes()
+                cfg = json.loads(raw)
+                self._last_cfg_hash = _config_digest(raw)
             except Exception as e:
                 print(f"Warning: could not read config ({e}), using defaults.")
 
@@ -279,13 +552,21 @@ class NodeManagerGUI:
         self.sv_electrs_data_path.set(cfg.get("electrs_data_path", defaults["electrs_data_path"]))
 
     def _save_config(self):
+        # Skip the write when nothing changed; otherwise write a temp file and
+        # rename it over the config so a crash never leaves it truncated.
+        payload = json.dumps({
+            "binaries_path":     str(self.binaries_path),
+            "bitcoin_data_path": str(self.bitcoin_data_path),
+            "electrs_data_path": str(self.electrs_data_path),
+        }, indent=2).encode()
+        digest = _config_digest(payload)
+        if digest == self._last_cfg_hash:
+            return
         try:
-            with open(self.config_path, 'w') as f:
-                json.dump({
-                    "binaries_path":     str(self.binaries_path),
-                    "bitcoin_data_path": str(self.bitcoin_data_path),
-                    "electrs_data_path": str(self.electrs_data_path),
-                }, f, indent=2)
+            tmp = self.config_path.with_suffix('.tmp')
+            tmp.write_bytes(payload)
+            os.replace(tmp, self.config_path)
+            self._last_cfg_hash = digest
         except Exception as e:
             messagebox.showerror("Config Error", f"Could not save config:\n{e}")
 
@@ -312,15 +593,17 @@ class NodeManagerGUI:
         tk.Label(stat_frame, text="BLOCK HEIGHT",
                  font=('Helvetica Neue', 9), fg=TEXT_TER, bg=BAR_BG
                  ).pack(anchor='w', pady=(10, 0))
+        self._block_height_text = "Connecting…"
         self.block_height_label = tk.Label(
-            stat_frame, text="Connecting…",
+            stat_frame, text=self._block_height_text,
             font=('Helvetica Neue', 16, 'bold'), fg=TEXT_MAIN, bg=BAR_BG
         )
         self.block_height_label.pack(anchor='w')
 
         # Update Binaries button (right)
-        make_btn(toolbar, "Update Binaries…", self.update_binaries,
-                 style='secondary').pack(side=tk.RIGHT, padx=16, pady=12)
+        self._update_btn = make_btn(toolbar, "Update Binaries…", self.update_binaries,
+                                    style='secondary')
+        self._update_btn.pack(side=tk.RIGHT, padx=16, pady=12)
 
         # Hairline under toolbar
         tk.Frame(self.root, bg=BORDER, height=1).pack(fill=tk.X)
@@ -510,13 +793,15 @@ class NodeManagerGUI:
                  ).pack(side=tk.LEFT)
 
         # Launch button uses accent colour — implemented as MacButton for reliable colours
-        MacButton(
+        launch_btn = MacButton(
             hrow, text="Launch",
             command=lambda: self.launch_node(node_type),
             bg=accent, fg=TEXT_WHITE, hover_bg=None,   # hover computed automatically
             font=('Helvetica Neue', 12, 'bold'),
             padx=18, pady=5
-        ).pack(side=tk.RIGHT)
+        )
+        launch_btn.pack(side=tk.RIGHT)
+        self._launch_btns[node_type] = launch_btn
 
         tk.Frame(parent, bg=BORDER, height=1).pack(fill=tk.X)
 
@@ -537,6 +822,7 @@ class NodeManagerGUI:
                           bg=PANEL_BG, highlightthickness=0)
             c.pack(side=tk.LEFT, padx=(0, 6))
             dot = c.create_oval(1, 1, 11, 11, fill=IND_OFF, outline='')
+            c._last_fill = IND_OFF
 
             tk.Label(badge, text=label_text,
                      font=('Helvetica Neue', 11), fg=TEXT_SEC, bg=PANEL_BG
@@ -555,25 +841,49 @@ class NodeManagerGUI:
 
         tk.Frame(parent, bg=BORDER, height=1).pack(fill=tk.X)
 
-        # Terminal
-        terminal = scrolledtext.ScrolledText(
-            parent,
-            font=('Menlo', 10),
-            bg=TERM_BG, fg=TERM_FG,
-            insertbackground=TERM_FG,
-            selectbackground='#264f78',
-            state=tk.DISABLED,
-            wrap=tk.WORD,
-            relief=tk.FLAT,
-            padx=10, pady=8,
-            borderwidth=0
-        )
-        terminal.pack(fill=tk.BOTH, expand=True)
+        # Terminal — only a placeholder for now; the ScrolledText is the most
+        # expensive widget here, so it is built on first use (see _terminal).
+        slot = tk.Frame(parent, bg=TERM_BG)
+        slot.pack(fill=tk.BOTH, expand=True)
+        self._terminal_slots[node_type] = slot
+
+    def _terminal(self, node_type):
+        terminal = self._terminals.get(node_type)
+        if terminal is None:
+            terminal = scrolledtext.ScrolledText(
+                self._terminal_slots[node_type],
+                font=('Menlo', 10),
+                bg=TERM_BG, fg=TERM_FG,
+                insertwidth=0,
+                selectbackground='#264f78',
+                wrap=tk.WORD,
+                relief=tk.FLAT,
+                padx=10, pady=8,
+                borderwidth=0
+            )
+            terminal.pack(fill=tk.BOTH, expand=True)
+            # Read-only without toggling -state around every insert
+            terminal.bind('<Key>', self._term_key)
+            for seq in ('<<Paste>>', '<<Cut>>', '<<Clear>>', '<<PasteSelection>>'):
+                terminal.bind(seq, lambda e: "break")
+            self._terminals[node_type] = terminal
+        return terminal
 
-        if node_type == "bitcoin":
-            self.bitcoin_terminal = terminal
-        else:
-            self.electrs_terminal = terminal
+    @staticmethod
+    def _term_key(event):
+        if event.keysym in _TERM_NAV_KEYS:
+            return None
+        if event.state & _TERM_COPY_MODS and event.keysym in _TERM_COPY_KEYS:
+            return None
+        return "break"
+
+    @property
+    def bitcoin_terminal(self):
+        return self._terminal("bitcoin")
+
+    @property
+    def electrs_terminal(self):
+        return self._terminal("electrs")
 
     # =========================================================================
     # bitcoin.conf + cookie auth
@@ -587,17 +897,59 @@ class NodeManagerGUI:
 
         self.rpc_port = 8332
         try:
-            with open(conf_path) as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('rpcport='):
-                        try:
-                            self.rpc_port = int(line.split('=', 1)[1].strip())
-                        except ValueError:
-                            pass
+            port = self._parse_conf(conf_path).get('rpcport')
+            if port:
+                try:
+                    self.rpc_port = int(port)
+                except ValueError:
+                    pass
         except Exception as e:
             self.log_to_terminal("bitcoin", f"Error reading bitcoin.conf: {e}")
 
+    def _parse_conf(self, path):
+        """
+        Return the RPC settings from bitcoin.conf as a key → value dict.  The
+        parse is cached against the file's mtime, so repeat calls cost a single
+        stat().  A missing file parses as empty; read errors propagate to the
+        caller.
+        """
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return {}
+        cached = self._conf_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        conf = {k.decode(): v.decode('utf-8', 'replace')
+                for k, v in _CONF_RE.findall(path.read_bytes())}
+        self._conf_cache[path] = (mtime, conf)
+        return conf
+
+    def _read_cookie(self, path):
+        """
+        Return (user, password) from a .cookie file, or None.  bitcoind only
+        rewrites the cookie when it restarts, so the result is cached by mtime
+        and dropped whenever we see bitcoind start.
+        """
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return None
+        cached = self._cookie_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        auth = None
+        try:
+            content = path.read_text().strip()
+            if ':' in content:
+                auth = tuple(content.split(':', 1))
+        except Exception:
+            pass
+        self._cookie_cache[path] = (mtime, auth)
+        return auth
+
     def _get_rpc_auth(self):
         """
         Prefer the .cookie file bitcoind writes on every start.
@@ -608,29 +960,17 @@ class NodeManagerGUI:
             self.bitcoin_data_path / ".cookie",
             self.bitcoin_data_path / "mainnet" / ".cookie",
         ]:
-            if cookie_path.exists():
-                try:
-                    content = cookie_path.read_text().strip()
-                    if ':' in content:
-                        return tuple(content.split(':', 1))
-                except Exception:
-                    pass
+            auth = self._read_cookie(cookie_path)
+            if auth:
+                return auth
 
         # Fallback: static credentials from bitcoin.conf
-        user = password = None
-        conf_path = self.bitcoin_data_path / "bitcoin.conf"
-        if conf_path.exists():
-            try:
-                with open(conf_path) as f:
-                    for line in f:
-                        line = line.strip()
-                        if line.startswith('rpcuser='):
-                            user = line.split('=', 1)[1].strip()
-                        elif line.startswith('rpcpassword='):
-                            password = line.split('=', 1)[1].strip()
-            except Exception:
-                pass
-        return (user or "bitcoin"), (password or "bitcoinrpc")
+        conf = {}
+        try:
+            conf = self._parse_conf(self.bitcoin_data_path / "bitcoin.conf")
+        except Exception:
+            pass
+        return (conf.get('rpcuser') or "bitcoin"), (conf.get('rpcpassword') or "bitcoinrpc")
 
     def create_default_bitcoin_conf(self):
         try:
@@ -669,7 +1009,9 @@ class NodeManagerGUI:
             self.bitcoin_data_path.mkdir(parents=True, exist_ok=True)
             cmd = [str(bitcoind_path), f"-datadir={self.bitcoin_data_path}",
                    "-printtoconsole"]
-            threading.Thread(target=self.run_bitcoind, args=(cmd,), daemon=True).start()
+            self.bitcoind_process = self._spawn_node("bitcoin", cmd)
+            if self.bitcoind_process:
+                self._set_bitcoin_running(True)
 
         elif node_type == "electrs":
             if self.electrs_process and self.electrs_process.poll() is None:
@@ -698,99 +1040,236 @@ class NodeManagerGUI:
                 "--electrum-rpc-addr", "127.0.0.1:50001",
             ]
             self.electrs_start_time = time.time()
-            threading.Thread(target=self.run_electrs, args=(cmd,), daemon=True).start()
+            self._electrs_sync_seen = False
+            self.electrs_process = self._spawn_node("electrs", cmd)
+            if self.electrs_process:
+                self._set_electrs_running(True)
 
-    def run_bitcoind(self, cmd):
-        try:
-            self.log_to_terminal("bitcoin", f"Starting: {' '.join(cmd)}")
-            self.bitcoind_process = subprocess.Popen(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                text=True, bufsize=1)
-            self.root.after(0, self._set_bitcoin_running, True)
-            for line in iter(self.bitcoind_process.stdout.readline, ''):
-                if line:
-                    self.bitcoin_queue.put(line.rstrip())
-            self.bitcoind_process.wait()
-            self.root.after(0, self._set_bitcoin_running, False)
-            self.log_to_terminal("bitcoin", "bitcoind stopped.")
-        except Exception as e:
-            self.log_to_terminal("bitcoin", f"Error: {e}")
-            self.root.after(0, self._set_bitcoin_running, False)
-
-    def run_electrs(self, cmd):
+    def _spawn_node(self, node_type, cmd):
+        """
+        Start a node and register its stdout with the log pump.
+        Returns the Popen handle, or None if the process could not start.
+        """
+        self.log_to_terminal(node_type, f"Starting: {shlex.join(cmd)}")
         try:
-            self.log_to_terminal("electrs", f"Starting: {' '.join(cmd)}")
-            self.electrs_process = subprocess.Popen(
+            # Every fd Python opens is already O_CLOEXEC (PEP 446), so there is
+            # nothing to sweep in the child.  close_fds=False skips that sweep
+            # and lets subprocess take its posix_spawn fast path where offered.
+            proc = subprocess.Popen(
                 cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
-                text=True, bufsize=1)
-            self.root.after(0, self._set_electrs_running, True)
-            for line in iter(self.electrs_process.stdout.readline, ''):
-                if line:
-                    stripped = line.rstrip()
-                    self.electrs_queue.put(stripped)
-                    self._check_electrs_sync_line(stripped)
-            self.electrs_process.wait()
-            self.root.after(0, self._set_electrs_running, False)
-            self.log_to_terminal("electrs", "electrs stopped.")
+                bufsize=0, close_fds=False)
         except Exception as e:
-            self.log_to_terminal("electrs", f"Error: {e}")
-            self.root.after(0, self._set_electrs_running, False)
+            self.log_to_terminal(node_type, f"Error: {e}")
+            return None
+        os.set_blocking(proc.stdout.fileno(), False)
+        self._log_selector.register(proc.stdout, selectors.EVENT_READ,
+                                    (node_type, bytearray()))
+        threading.Thread(target=self._await_exit, args=(node_type, proc),
+                         daemon=True).start()
+        return proc
+
+    def _await_exit(self, node_type, proc):
+        # Blocks in waitpid() until the node exits — no polling
+        proc.wait()
+        self.root.after(0, self._on_node_exit, node_type, proc)
+
+    def _on_node_exit(self, node_type, proc):
+        # Runs on the Tk thread; ignore exits from a handle already replaced
+        # by a relaunch.
+        if node_type == "bitcoin":
+            if proc is self.bitcoind_process:
+                self._set_bitcoin_running(False)
+        elif proc is self.electrs_process:
+            self._set_electrs_running(False)
 
-    def _check_electrs_sync_line(self, line):
-        lower = line.lower()
-        if any(p in lower for p in [
-            "finished full compaction",
-            "electrs running",
-            "waiting for new block",
-        ]):
-            self.root.after(0, self._set_electrs_synced, True)
+    def _pump_logs(self):
+        """
+        Drain every registered node pipe from a single thread.  The selector
+        (epoll/kqueue) only wakes us when a pipe has data, so one thread serves
+        both nodes instead of a blocking reader thread per process.  There is
+        no timeout: pipes registered while we are blocked are picked up by the
+        kernel wait itself, so an idle app costs no periodic wakeups.
+        """
+        # Reused for every read: readv() scatters into these in one syscall,
+        # and only the filled prefix is copied on into the line buffer.
+        bufs  = [bytearray(PIPE_CHUNK) for _ in range(PIPE_BUFS)]
+        views = [memoryview(b) for b in bufs]
+        while True:
+            for key, _ in self._log_selector.select():
+                node_type, tail = key.data
+                try:
+                    n = os.readv(key.fd, bufs)
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    n = 0
+
+                if n:
+                    for view in views:
+                        if n <= 0:
+                            break
+                        tail += view[:n]
+                        n -= len(view)
+                    block = _take_lines(tail)
+                    if block is not None:
+                        self._on_node_output(node_type, block)
+                    continue
+
+                # EOF — the node closed stdout, i.e. it is exiting
+                self._log_selector.unregister(key.fileobj)
+                key.fileobj.close()
+                if tail:
+                    self._on_node_output(node_type, bytes(tail))
+                self.log_to_terminal(
+                    node_type,
+                    "bitcoind stopped." if node_type == "bitcoin" else "electrs stopped.")
+
+    def _on_node_output(self, node_type, block: bytes):
+        # Split on \n only, as the line reader did: blank lines are kept, and
+        # form feeds or other exotic breaks in node output stay inside a line.
+        lines = [line.rstrip('\r')
+                 for line in block.decode('utf-8', 'replace').split('\n')]
+        if node_type == "bitcoin":
+            self.bitcoin_queue.append(lines)
+        else:
+            if not self._electrs_sync_seen:
+                self._check_electrs_sync_line(block)
+            self.electrs_queue.append(lines)
+        self._notify_log()
+
+    def _check_electrs_sync_line(self, block: bytes) -> bool:
+        # Scans a whole block of complete lines in one pass.  Latches on the
+        # first match: once electrs has reported it is synced the pump stops
+        # scanning until the next launch re-arms the flag.  _drain_terminals
+        # applies the latch on the Tk thread, so the pump never calls into Tk.
+        if _ELECTRS_SYNC_RE.search(block):
+            self._electrs_sync_seen = True
+            return True
+        return False
 
     # ── Thread-safe state setters ─────────────────────────────────────────────
 
     def _set_bitcoin_running(self, value: bool):
         self.bitcoin_running = value
-        if not value:
+        if value:
+            # A fresh bitcoind writes a new cookie; never trust the old one,
+            # even if the rewrite lands within the same mtime tick.
+            self._cookie_cache.clear()
+            self._rpc_auth    = None
+            self._longpoll_ok = True
+            self._longpoll_refused = False
+        else:
             self.bitcoin_synced       = False
             self.current_block_height = 0
-            self.update_block_height_display()
-        self.update_indicators()
+        self._mark_dirty()
 
     def _set_electrs_running(self, value: bool):
         self.electrs_running = value
         if not value:
             self.electrs_synced = False
-        self.update_indicators()
+        self._mark_dirty()
 
     def _set_electrs_synced(self, value: bool):
         self.electrs_synced = value
-        self.update_indicators()
+        self._mark_dirty()
 
     # ── Terminal ──────────────────────────────────────────────────────────────
 
     def log_to_terminal(self, terminal_type, message):
+        # Queue items are batches of lines, matching what the pipe readers put.
         if terminal_type == "bitcoin":
-            self.bitcoin_queue.put(message)
+            self.bitcoin_queue.append([message])
         else:
-            self.electrs_queue.put(message)
+            self.electrs_queue.append([message])
+        self._notify_log()
 
-    def update_terminals(self):
-        for q, terminal in [
-            (self.bitcoin_queue, self.bitcoin_terminal),
-            (self.electrs_queue, self.electrs_terminal),
+    def _notify_log(self):
+        """
+        Wake the Tk thread to drain the terminal queues.  Safe from any thread.
+        Only the first notify after a drain writes a byte to the wake pipe; the
+        pipe write never waits on Tk, unlike a Tk call from another thread, so
+        the log pump keeps reading even while the UI is blocked in a shutdown
+        wait.
+        """
+        if self._log_pending:
+            return
+        self._log_pending = True
+        try:
+            os.write(self._log_wake_w, b'\0')
+        except OSError:
+            pass   # pipe full (a wake is already queued) or closed at exit
+
+    def _on_log_wake(self, fd, _mask):
+        # Tk file handler for the wake pipe's read end
+        try:
+            os.read(fd, 512)
+        except BlockingIOError:
+            pass
+        self._drain_terminals()
+
+    def _drain_terminals(self):
+        # Clear the flag first so output queued while we drain wakes us again
+        self._log_pending = False
+        # The pump only latches the electrs sync marker; apply it here, on the
+        # Tk thread, and only while electrs is still running.
+        if self._electrs_sync_seen and self.electrs_running and not self.electrs_synced:
+            self._set_electrs_synced(True)
+        backlog = False
+        for node_type, q in [
+            ("bitcoin", self.bitcoin_queue),
+            ("electrs", self.electrs_queue),
         ]:
-            try:
-                while True:
-                    msg = q.get_nowait()
-                    terminal.config(state=tk.NORMAL)
-                    terminal.insert(tk.END, msg + "\n")
-                    terminal.see(tk.END)
-                    terminal.config(state=tk.DISABLED)
-            except queue.Empty:
-                pass
-        self.root.after(100, self.update_terminals)
+            if not q:
+                continue
+            lines = []
+            while q and len(lines) < TERM_DRAIN_MAX:
+                lines.extend(q.popleft())
+            if len(lines) > TERM_DRAIN_MAX:
+                q.appendleft(lines[TERM_DRAIN_MAX:])
+                del lines[TERM_DRAIN_MAX:]
+            backlog = backlog or bool(q)
+            terminal = self._terminal(node_type)
+            terminal.insert(tk.END, "\n".join(lines) + "\n")
+            # Trim scrollback so memory and re-layout cost stay bounded over a
+            # long session ('end-1c' sits on the empty line after the last \n).
+            excess = int(terminal.index('end-1c').split('.')[0]) - 1 - TERM_MAX_LINES
+            if excess > 0:
+                terminal.delete('1.0', f'{excess + 1}.0')
+            terminal.see(tk.END)
+
+        # Leftovers continue from a 1 ms timer rather than an immediate loop,
+        # so a burst of node output cannot starve input and redraw events.
+        # The flag stays set meanwhile: the timer is the pending wake.
+        if backlog:
+            self._log_pending = True
+            if self._log_backlog_after is None:
+                self._log_backlog_after = self.root.after(1, self._drain_backlog)
+
+    def _drain_backlog(self):
+        self._log_backlog_after = None
+        self._drain_terminals()
+
+    def update_terminals(self):
+        # Watchdog only — output normally arrives via the wake pipe
+        self._drain_terminals()
+        self.root.after(1000, self.update_terminals)
 
     # ── Indicators ───────────────────────────────────────────────────────────
 
+    def _mark_dirty(self):
+        """
+        Schedule one redraw of the indicators and block height for the next
+        idle cycle.  Bursts of state changes collapse into a single repaint.
+        """
+        if not self._ui_dirty:
+            self._ui_dirty = True
+            self.root.after_idle(self._flush_ui)
+
+    def _flush_ui(self):
+        self._ui_dirty = False
+        self.update_indicators()
+        self.update_block_height_display()
+
     def update_indicators(self):
         self._set_dot(self.bitcoin_running_indicator, self.bitcoin_running)
         self._set_dot(self.bitcoin_synced_indicator,  self.bitcoin_synced)
@@ -800,70 +1279,169 @@ class NodeManagerGUI:
         self._set_dot(self.electrs_ready_indicator,   self.electrs_running and self.electrs_synced)
 
     def _set_dot(self, indicator, active: bool):
+        # Remember the last colour drawn so an unchanged dot costs no Tcl call
         canvas, dot = indicator
-        canvas.itemconfig(dot, fill=IND_GREEN if active else IND_OFF)
+        color = IND_GREEN if active else IND_OFF
+        if getattr(canvas, '_last_fill', None) == color:
+            return
+        canvas.itemconfig(dot, fill=color)
+        canvas._last_fill = color
 
     def update_block_height_display(self):
         if self.current_block_height > 0:
-            self.block_height_label.config(text=f"{self.current_block_height:,}")
+            text = f"{self.current_block_height:,}"
         else:
-            self.block_height_label.config(text="Connecting…")
+            text = "Connecting…"
+        if text != self._block_height_text:
+            self.block_height_label.config(text=text)
+            self._block_height_text = text
 
     # ── Monitoring ────────────────────────────────────────────────────────────
 
     def start_monitoring(self):
+        self.root.tk.createfilehandler(self._log_wake_r, tk.READABLE, self._on_log_wake)
         self.update_terminals()
-        threading.Thread(target=self.monitor_bitcoin_rpc,     daemon=True).start()
-        threading.Thread(target=self.monitor_electrs_process, daemon=True).start()
+        threading.Thread(target=self._pump_logs, daemon=True).start()
+
+        self._scheduler = _Scheduler(self._stop_evt)
+        self._scheduler.add(self.monitor_bitcoin_rpc, 5)
+        threading.Thread(target=self._scheduler.run, daemon=True).start()
 
     def monitor_bitcoin_rpc(self):
-        while True:
-            try:
-                if self.bitcoin_running:
-                    info = self.rpc_call("getblockchaininfo")
-                    if info:
-                        blocks   = info.get("blocks",               0)
-                        headers  = info.get("headers",              0)
-                        progress = info.get("verificationprogress", 0.0)
-
-                        def _update(b=blocks, h=headers, p=progress):
-                            self.current_block_height = b
-                            self.update_block_height_display()
-                            self.bitcoin_synced = (h > 0) and (b >= h - 1) and (p > 0.9999)
-                            self.update_indicators()
-
-                        self.root.after(0, _update)
-                time.sleep(5)
-            except Exception:
-                time.sleep(10)
+        """
+        Poll getblockchaininfo every 5 s while bitcoind is syncing.  Once it
+        is synced, long-poll waitfornewblock first: bitcoind holds the request
+        until the tip moves (or LONGPOLL_MS passes), so new blocks show up
+        immediately.  An idle node then costs two calls per interval — the
+        long-poll and the getblockchaininfo that follows it.  A long-poll that
+        times out or cannot connect falls back to one plain 5 s poll; the next
+        successful synced poll re-arms it.  If bitcoind refuses the method
+        outright, plain polling stays until bitcoind is restarted.
+
+        Scheduler task: returns the seconds until the next check.
+        """
+        try:
+            if not self.bitcoin_running:
+                return 5
+            delay = 5
+            longpoll = self.bitcoin_synced and self._longpoll_ok
+            if longpoll:
+                tip, refused = self._rpc_call_checked(
+                    "waitfornewblock", [LONGPOLL_MS], LONGPOLL_MS / 1000 + 5)
+                if tip is None:
+                    # Plain polling for now; for good if bitcoind refused it
+                    self._longpoll_ok = False
+                    self._longpoll_refused = self._longpoll_refused or refused
+                else:
+                    delay = 0
+            info = self.rpc_call("getblockchaininfo")
+            if info and self.bitcoin_running:
+                blocks   = info.get("blocks",               0)
+                headers  = info.get("headers",              0)
+                progress = info.get("verificationprogress", 0.0)
+                synced   = (headers > 0) and (blocks >= headers - 1) and (progress > 0.9999)
+                if synced and not longpoll and not self._longpoll_refused:
+                    self._longpoll_ok = True
+                self.root.after(0, self._apply_chain_info, blocks, synced)
+            return delay
+        except Exception:
+            return 10
 
-    def monitor_electrs_process(self):
-        while True:
-            try:
-                if self.electrs_process is not None:
-                    if self.electrs_process.poll() is not None and self.electrs_running:
-                        self.root.after(0, self._set_electrs_running, False)
-                time.sleep(5)
-            except Exception:
-                time.sleep(10)
+    def _apply_chain_info(self, blocks, synced):
+        # Tk thread.  bitcoind may have stopped while the poll was in flight;
+        # _set_bitcoin_running(False) has then already cleared these, and a
+        # stale result must not bring them back.
+        if not self.bitcoin_running:
+            return
+        self.current_block_height = blocks
+        self.bitcoin_synced       = synced
+        self._mark_dirty()
 
     # ── RPC ───────────────────────────────────────────────────────────────────
 
-    def rpc_call(self, method, params=None):
-        user, password = self._get_rpc_auth()
-        if not user or not password:
+    def _rpc_http_auth(self):
+        """
+        HTTPBasicAuth for bitcoind, held in memory so a steady-state poll
+        touches no files at all.  The cache is dropped on a 401, a failed
+        connection or a bitcoind start — the only times the cookie can change.
+        """
+        auth = self._rpc_auth
+        if auth is None:
+            user, password = self._get_rpc_auth()
+            if not user or not password:
+                return None
+            auth = self._rpc_auth = requests.auth.HTTPBasicAuth(user, password)
+        return auth
+
+    def _rpc_post(self, payload, timeout):
+        """POST a JSON-RPC payload; returns the Response, or None on failure."""
+        for _ in range(2):
+            auth = self._rpc_http_auth()
+            if auth is None:
+                return None
+            try:
+                r = self._rpc_session.post(
+                    f"http://127.0.0.1:{self.rpc_port}/",
+                    data=_json_dumps(payload),
+                    auth=auth,
+                    timeout=timeout
+                )
+            except requests.exceptions.RequestException:
+                self._rpc_auth = None   # bitcoind may be restarting
+                return None
+            if r.status_code != 401:
+                return r
+            self._rpc_auth = None       # stale credentials — re-read, retry once
+        return None
+
+    def rpc_call(self, method, params=None, timeout=5):
+        return self._rpc_call_checked(method, params, timeout)[0]
+
+    def _rpc_call_checked(self, method, params=None, timeout=5):
+        """
+        Like rpc_call, but returns (result, refused).  *refused* is True when
+        bitcoind rejected the method itself (HTTP 403/404 or "Method not
+        found"), so callers can tell that apart from a timeout or a dropped
+        connection, which are worth retrying.
+        """
+        r = self._rpc_post(
+            {"jsonrpc": "1.0", "id": "nm", "method": method, "params": params or []},
+            timeout)
+        if r is None:
+            return None, False
+        try:
+            body = _json_loads(r.content)
+        except ValueError:
+            body = None
+        error = body.get('error') if isinstance(body, dict) else None
+        if r.status_code in _RPC_REFUSED_STATUS or (
+                isinstance(error, dict) and error.get('code') == _RPC_METHOD_NOT_FOUND):
+            return None, True
+        if r.status_code == 200 and isinstance(body, dict):
+            return body.get('result'), False
+        return None, False
+
+    def rpc_batch_call(self, calls):
+        """
+        Run several RPCs in one HTTP round-trip using JSON-RPC batching.
+        *calls* is a list of (method, params) pairs.  Returns the results in
+        the same order (None for any call bitcoind rejected), or None if the
+        request itself failed.
+        """
+        if not calls:
             return None
+        r = self._rpc_post([
+            {"jsonrpc": "1.0", "id": i, "method": method, "params": params or []}
+            for i, (method, params) in enumerate(calls)
+        ], 5)
         try:
-            r = requests.post(
-                f"http://127.0.0.1:{self.rpc_port}/",
-                json={"jsonrpc": "1.0", "id": "nm", "method": method, "params": params or []},
-                headers={'content-type': 'application/json'},
-                auth=(user, password),
-                timeout=5
-            )
-            if r.status_code == 200:
-                return r.json().get('result')
-        except requests.exceptions.RequestException:
+            if r is not None and r.status_code == 200:
+                results = [None] * len(calls)
+                for item in _json_loads(r.content):
+                    if isinstance(item.get('id'), int) and 0 <= item['id'] < len(calls):
+                        results[item['id']] = item.get('result')
+                return results
+        except (ValueError, AttributeError):
             pass
         return None
 
@@ -894,17 +1472,42 @@ class NodeManagerGUI:
 
     def _stop_bitcoind_rpc(self):
         self.rpc_call("stop")
-        if self.bitcoind_process:
+        proc = self.bitcoind_process
+        exited = proc is None or self._wait_for_exit(proc, 60)
+        if self._closing:
+            return   # on_closing owns the shutdown now and may have destroyed root
+        if not exited:
+            self.log_to_terminal("bitcoin", "bitcoind did not stop in time — killing.")
+            proc.kill()
+        try:
+            self.root.after(0, self._set_bitcoin_running, False)
+        except (RuntimeError, tk.TclError):
+            pass   # window closed in the meantime
+
+    def _wait_for_exit(self, proc, total, tick=1.0, on_tick=None):
+        """
+        Wait up to *total* seconds for *proc* to exit, in *tick*-second slices.
+        Between slices, gives up early if the app is shutting down and calls
+        *on_tick* (e.g. to let Tk redraw).  Returns True once the process has
+        exited, False on timeout or early exit.
+        """
+        deadline = time.monotonic() + total
+        while time.monotonic() < deadline:
             try:
-                self.bitcoind_process.wait(timeout=60)
+                proc.wait(timeout=min(tick, max(0.0, deadline - time.monotonic())))
+                return True
             except subprocess.TimeoutExpired:
-                self.log_to_terminal("bitcoin", "bitcoind did not stop in time — killing.")
-                self.bitcoind_process.kill()
-        self.root.after(0, self._set_bitcoin_running, False)
+                if self._stop_evt.is_set():
+                    return False
+                if on_tick:
+                    on_tick()
+        return proc.poll() is not None
 
     # ── Binary update ─────────────────────────────────────────────────────────
 
     def update_binaries(self):
+        if self._updating_binaries:
+            return
         downloads_path = Path.home() / "Downloads" / "bitcoin_builds"
         if not downloads_path.exists():
             bitforge = Path("/Applications/BitForge.app")
@@ -923,69 +1526,117 @@ class NodeManagerGUI:
             messagebox.showerror("Error", f"No 'binaries' sub-folder in:\n{downloads_path}")
             return
 
+        # The scan and the copies can take seconds on a slow disk — keep them
+        # off the Tk thread and hand the outcome back via root.after.  Until
+        # then nothing may start a second copy or exec a half-written binary.
+        self._set_updating_binaries(True)
+        threading.Thread(target=self._update_binaries_worker,
+                         args=(binaries_src, self.binaries_path),
+                         daemon=True).start()
+
+    def _set_updating_binaries(self, busy: bool):
+        self._updating_binaries = busy
+        for btn in [self._update_btn, *self._launch_btns.values()]:
+            btn.set_enabled(not busy)
+
+    def _update_binaries_worker(self, binaries_src, dest):
+        """Background thread: find the newest builds and copy them into dest."""
+        updated = []
+        errors  = []
+        try:
+            found = self._copy_latest_binaries(binaries_src, dest, updated, errors)
+        except Exception as e:
+            errors.append(f"Unexpected error while updating binaries:\n{e}")
+            found = True
+        self.root.after(0, self._report_binaries_update, found, updated, errors)
+
+    def _copy_latest_binaries(self, binaries_src, dest, updated, errors):
+        # Returns False if there was no versioned build folder to copy from
         btc_ver = self._find_latest_version(binaries_src, "bitcoin")
         etr_ver = self._find_latest_version(binaries_src, "electrs")
-
         if not btc_ver and not etr_ver:
-            messagebox.showinfo("Nothing Found", "No bitcoin-X.Y.Z or electrs-X.Y.Z folders found.")
-            return
+            return False
 
-        self.binaries_path.mkdir(parents=True, exist_ok=True)
-        updated = []
+        try:
+            dest.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            errors.append(f"Cannot create {dest}:\n{e}")
+            return True
         if btc_ver:
             if self._copy_binaries(binaries_src / btc_ver,
-                                   ["bitcoind", "bitcoin-cli", "bitcoin-tx", "bitcoin-util"]):
+                                   ["bitcoind", "bitcoin-cli", "bitcoin-tx", "bitcoin-util"],
+                                   errors, dest):
                 updated.append(f"Bitcoin ({btc_ver})")
         if etr_ver:
-            if self._copy_binaries(binaries_src / etr_ver, ["electrs"]):
+            if self._copy_binaries(binaries_src / etr_ver, ["electrs"], errors, dest):
                 updated.append(f"Electrs ({etr_ver})")
+        return True
 
+    def _report_binaries_update(self, found, updated, errors):
+        self._set_updating_binaries(False)
+        if not found:
+            messagebox.showinfo("Nothing Found", "No bitcoin-X.Y.Z or electrs-X.Y.Z folders found.")
+            return
+        if errors:
+            messagebox.showerror("Copy Error", "\n\n".join(errors))
         if updated:
             messagebox.showinfo("Success", "Updated:\n" + "\n".join(updated))
         else:
             messagebox.showwarning("Warning", "No binaries were updated.")
 
     def _find_latest_version(self, path, prefix):
-        pattern  = re.compile(rf"^{re.escape(prefix)}-(\d+(?:\.\d+)*)$")
+        pattern  = _version_re(prefix)
         versions = []
         try:
-            for item in path.iterdir():
-                if item.is_dir():
-                    m = pattern.match(item.name)
-                    if m:
+            # scandir's entries carry the d_type from the directory read, so
+            # is_dir() costs no extra stat() (except for symlinks)
+            with os.scandir(path) as it:
+                for entry in it:
+                    m = pattern.match(entry.name)
+                    if m and entry.is_dir():
                         versions.append(
-                            (tuple(int(x) for x in m.group(1).split('.')), item.name))
+                            (tuple(int(x) for x in m.group(1).split('.')), entry.name))
         except OSError:
             return None
-        return versions and sorted(versions, reverse=True)[0][1]
+        return versions and max(versions)[1]
 
-    def _copy_binaries(self, src_dir, names):
+    def _copy_binaries(self, src_dir, names, errors, dest):
+        """
+        Copy *names* from *src_dir* into *dest* concurrently — each copy is
+        independent and disk-bound, so the OS can overlap them.  Failures are
+        appended to *errors* for one combined dialog.  Returns True if anything was copied.
+        """
         copied = False
-        for name in names:
-            src = src_dir / name
-            if src.exists():
-                dst = self.binaries_path / name
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+            jobs = {}
+            for name in names:
+                src = src_dir / name
+                if src.exists():
+                    dst = dest / name
+                    jobs[pool.submit(_copy_executable, src, dst)] = (name, dst)
+            for fut, (name, dst) in jobs.items():
                 try:
-                    shutil.copy2(src, dst)
-                    os.chmod(dst, 0o755)
+                    fut.result()
                     copied = True
                     self.log_to_terminal("bitcoin", f"Copied {name} → {dst}")
                 except Exception as e:
-                    messagebox.showerror("Copy Error", f"Failed to copy {name}:\n{e}")
+                    errors.append(f"Failed to copy {name}:\n{e}")
         return copied
 
     # ── Window close ──────────────────────────────────────────────────────────
 
     def on_closing(self):
         if messagebox.askyesno("Quit", "Shutdown nodes and exit?"):
+            self._closing = True
             self._terminate_electrs()
             if self.bitcoin_running:
                 self.rpc_call("stop")
-                if self.bitcoind_process:
-                    try:
-                        self.bitcoind_process.wait(timeout=30)
-                    except subprocess.TimeoutExpired:
-                        self.bitcoind_process.kill()
+                proc = self.bitcoind_process
+                # Keep repainting while bitcoind flushes its state to disk
+                if proc and not self._wait_for_exit(
+                        proc, 30, on_tick=self.root.update_idletasks):
+                    proc.kill()
+            self._stop_evt.set()   # wake the monitor threads so they exit now
             self.root.destroy()
 
 
@@ -993,34 +1644,18 @@ class NodeManagerGUI:
 # Entry point
 # ---------------------------------------------------------------------------
 
-def _acquire_instance_lock():
-    """
-    Try to acquire an exclusive lock on a temp file.
-    Returns the open file object (lock held) or None (lock not available).
-    The caller must keep the file object alive for the lock to persist.
-    """
-    if not _HAVE_FCNTL:
-        return None  # non-Unix — skip the guard
-
-    lock_path = Path("/tmp") / f"{APP_NAME}.lock"
-    try:
-        fh = open(lock_path, 'w')
-        _fcntl.flock(fh, _fcntl.LOCK_EX | _fcntl.LOCK_NB)
-        fh.write(str(os.getpid()))
-        fh.flush()
-        return fh          # caller holds this to keep lock alive
-    except OSError:
-        return None        # another instance already holds the lock
-
-
 def main():
     # ── Single-instance guard ────────────────────────────────────────────────
-    # Acquire the lock BEFORE creating any Tk window.  If we can't get it,
-    # a duplicate instance is already running — exit immediately and silently.
-    _lock_fh = _acquire_instance_lock()
-    if _lock_fh is None and _HAVE_FCNTL:
-        # Lock unavailable — duplicate launch, just quit
-        sys.exit(0)
+    # Normally already taken at import time (see top of file); acquire it here
+    # only when main() is invoked some other way.  If we can't get it, a
+    # duplicate instance is already running — exit immediately and silently.
+    global _instance_lock
+    if _instance_lock is None:
+        _instance_lock = _acquire_instance_lock()
+        if _instance_lock is None and _HAVE_FCNTL:
+            # Lock unavailable — duplicate launch, just quit
+            sys.exit(0)
+    _lock_fh = _instance_lock
 
     # ── Also call freeze_support for PyInstaller / multiprocessing safety ────
     try:
@@ -1044,10 +1679,10 @@ def main():
             pass
         sys.exit(1)
     finally:
-        # Release the lock on clean exit so the app can be relaunched
+        # Release the lock on clean exit so the app can be relaunched —
+        # closing the socket or file drops it either way
         if _lock_fh is not None:
             try:
-                _fcntl.flock(_lock_fh, _fcntl.LOCK_UN)
                 _lock_fh.close()
             except Exception:
                 pass